@@ -1,5 +1,51 @@
 import numpy as np
+import scipy
+import scipy.sparse as sp
+import hashlib
 import os
+import pickle
+
+try:
+    from numba import njit
+except ImportError:  # numba é opcional: sem ele, a verificação usa NumPy/SciPy
+    njit = None
+
+# Diretório do cache de instâncias já lidas (chave: caminho, mtime, tamanho e
+# versões de NumPy/SciPy), ao lado deste arquivo e não no diretório corrente.
+# CACHE_VERSION deve mudar sempre que os atributos gerados pela leitura mudarem.
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+CACHE_VERSION = 3
+
+# Matrizes pedido/corredor x item densas (int32) quando cabem no orçamento de
+# memória e são densas o bastante para a varredura contígua superar a CSR.
+# Só a verificação sem numba as usa: são montadas sob demanda e não vão ao cache
+DENSE_MEMORY_BUDGET = 512 * 1024 ** 2  # bytes
+DENSE_MIN_DENSITY = 0.05
+
+if njit is not None:
+    @njit(cache=True)
+    def _feasibility_kernel(order_indptr, order_indices, order_data,
+                            aisle_indptr, aisle_indices, aisle_data,
+                            selected_orders, visited_aisles, n_items, lb, ub):
+        # Acumula demanda e total de unidades percorrendo só as linhas
+        # selecionadas das CSR; depois desconta a oferta dos corredores
+        balance = np.zeros(n_items, dtype=np.int64)
+        total = 0
+        for order in selected_orders:
+            for k in range(order_indptr[order], order_indptr[order + 1]):
+                balance[order_indices[k]] += order_data[k]
+                total += order_data[k]
+        if total < lb or total > ub:
+            return False
+        for aisle in visited_aisles:
+            for k in range(aisle_indptr[aisle], aisle_indptr[aisle + 1]):
+                balance[aisle_indices[k]] -= aisle_data[k]
+        for item in range(n_items):
+            if balance[item] > 0:
+                return False
+        return True
+else:
+    _feasibility_kernel = None
 
 class WaveOrderPicking:
     def __init__(self):
@@ -7,77 +53,169 @@ class WaveOrderPicking:
         self.aisles = None
         self.wave_size_lb = None
         self.wave_size_ub = None
+        self.orders_csr = None
+        self.aisles_csr = None
+        self.order_totals = None
+        self._matrices = None
 
     def read_input(self, input_file_path):
+        # Reaproveita a leitura anterior se o arquivo não mudou desde então
+        stat = os.stat(input_file_path)
+        key = (f"{CACHE_VERSION}:{np.__version__}:{scipy.__version__}:"
+               f"{os.path.abspath(input_file_path)}:{stat.st_mtime_ns}:{stat.st_size}")
+        cache_path = os.path.join(CACHE_DIR, hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + ".pkl")
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as file:
+                    cached = pickle.load(file)
+                self.__dict__.update(cached)
+                self._matrices = None
+                return
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+                pass  # entrada corrompida ou ilegível: relê a instância e a regrava
+
+        self._parse_input(input_file_path)
+
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as file:
+                pickle.dump({k: v for k, v in self.__dict__.items() if k != '_matrices'}, file, protocol=5)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # sem cache (ex.: diretório somente leitura)
+
+    def _parse_input(self, input_file_path):
+        # Todos os números do arquivo convertidos de uma vez (em C); cada linha
+        # começa com seu número de pares, então basta um cursor para achá-las
         with open(input_file_path, 'r') as file:
-            lines = file.readlines()
-            first_line = lines[0].strip().split()
-            o, i, a = int(first_line[0]), int(first_line[1]), int(first_line[2])
-
-            self.orders = []
-            for j in range(o):
-                order_line = lines[j + 1].strip().split()
-                d = int(order_line[0])
-                order_map = {int(order_line[2 * k + 1]): int(order_line[2 * k + 2]) for k in range(d)}
-                self.orders.append(order_map)
-
-            self.aisles = []
-            for j in range(a):
-                aisle_line = lines[j + o + 1].strip().split()
-                d = int(aisle_line[0])
-                aisle_map = {int(aisle_line[2 * k + 1]): int(aisle_line[2 * k + 2]) for k in range(d)}
-                self.aisles.append(aisle_map)
-
-            bounds = lines[o + a + 1].strip().split()
-            self.wave_size_lb = int(bounds[0])
-            self.wave_size_ub = int(bounds[1])
+            tokens = np.fromstring(file.read(), dtype=np.int64, sep=' ')
+        values = tokens.tolist()
+        o, i, a = values[0], values[1], values[2]
+
+        order_starts, pos = self._line_starts(values, 3, o)
+        aisle_starts, pos = self._line_starts(values, pos, a)
+        self.wave_size_lb = values[pos]
+        self.wave_size_ub = values[pos + 1]
+
+        self.orders = [self._item_map(values, start) for start in order_starts]
+        self.aisles = [self._item_map(values, start) for start in aisle_starts]
+
+        # Matrizes esparsas (linhas = pedidos/corredores, colunas = itens)
+        self.orders_csr = self._to_csr(tokens, order_starts, i)
+        self.aisles_csr = self._to_csr(tokens, aisle_starts, i)
+        self.order_totals = np.asarray(self.orders_csr.sum(axis=1)).ravel()
+        self._matrices = None
+
+    # Representação usada na verificação sem numba: densa ou a própria CSR
+    @property
+    def orders_matrix(self):
+        return self._dense_matrices()[0]
+
+    @property
+    def aisles_matrix(self):
+        return self._dense_matrices()[1]
+
+    def _dense_matrices(self):
+        if self._matrices is None:
+            self._matrices = (self._dense_if_worth(self.orders_csr), self._dense_if_worth(self.aisles_csr))
+        return self._matrices
+
+    @staticmethod
+    def _dense_if_worth(matrix):
+        cells = matrix.shape[0] * matrix.shape[1]
+        if 0 < cells and 4 * cells <= DENSE_MEMORY_BUDGET and matrix.nnz >= DENSE_MIN_DENSITY * cells:
+            return matrix.astype(np.int32).toarray()
+        return matrix
+
+    @staticmethod
+    def _line_starts(values, pos, count):
+        starts = []
+        for _ in range(count):
+            starts.append(pos)
+            pos += 1 + 2 * values[pos]
+        return starts, pos
+
+    @staticmethod
+    def _item_map(values, start):
+        pairs = values[start + 1:start + 1 + 2 * values[start]]
+        return dict(zip(pairs[0::2], pairs[1::2]))
+
+    @staticmethod
+    def _to_csr(tokens, starts, n_items):
+        # Posição do k-ésimo par de cada linha: início + 1 + 2k
+        starts = np.asarray(starts, dtype=np.intp)
+        counts = tokens[starts]
+        indptr = np.zeros(len(starts) + 1, dtype=np.intp)
+        np.cumsum(counts, out=indptr[1:])
+        offsets = np.arange(indptr[-1]) - np.repeat(indptr[:-1], counts)
+        item_pos = np.repeat(starts + 1, counts) + 2 * offsets
+        return sp.csr_matrix((tokens[item_pos + 1], tokens[item_pos], indptr), shape=(len(starts), n_items))
 
     def read_output(self, output_file_path):
+        # Arquivo inteiro convertido de uma vez; as contagens delimitam as seções
         with open(output_file_path, 'r') as file:
-            lines = file.readlines()
-            num_orders = int(lines[0].strip())
-            selected_orders = [int(lines[i + 1].strip()) for i in range(num_orders)]
-            num_aisles = int(lines[num_orders + 1].strip())
-            visited_aisles = [int(lines[num_orders + 2 + i].strip()) for i in range(num_aisles)]
-
-        selected_orders = list(set(selected_orders))
-        visited_aisles = list(set(visited_aisles))
+            values = np.fromstring(file.read(), dtype=np.intp, sep=' ')
+        num_orders = int(values[0])
+        selected_orders = values[1:num_orders + 1]
+        num_aisles = int(values[num_orders + 1])
+        visited_aisles = values[num_orders + 2:num_orders + 2 + num_aisles]
+        if len(visited_aisles) != num_aisles:
+            raise IndexError("arquivo de saída com menos corredores que o informado")
+
+        # np.unique remove repetidos e devolve índices ordenados, prontos para
+        # indexar as matrizes de pedidos/corredores
+        selected_orders = np.unique(selected_orders)
+        visited_aisles = np.unique(visited_aisles)
         return selected_orders, visited_aisles
 
     def is_solution_feasible(self, selected_orders, visited_aisles):
-        total_units_picked = 0
-        for order in selected_orders:
-            total_units_picked += np.sum(list(self.orders[order].values()))
+        selected_orders = np.asarray(selected_orders, dtype=np.intp)
+        visited_aisles = np.asarray(visited_aisles, dtype=np.intp)
+        if _feasibility_kernel is not None and self._in_range(selected_orders, self.orders_csr.shape[0]) \
+                and self._in_range(visited_aisles, self.aisles_csr.shape[0]):
+            return bool(_feasibility_kernel(
+                self.orders_csr.indptr, self.orders_csr.indices, self.orders_csr.data,
+                self.aisles_csr.indptr, self.aisles_csr.indices, self.aisles_csr.data,
+                selected_orders, visited_aisles, self.orders_csr.shape[1],
+                self.wave_size_lb, self.wave_size_ub))
+
+        total_units_picked = self.order_totals[selected_orders].sum()
 
         if not (self.wave_size_lb <= total_units_picked <= self.wave_size_ub):
             return False
 
-        required_items = set()
-        for order in selected_orders:
-            required_items.update(self.orders[order].keys())
-
-        for item in required_items:
-            total_required = sum(self.orders[order].get(item, 0) for order in selected_orders)
-            total_available = sum(self.aisles[aisle].get(item, 0) for aisle in visited_aisles)
-            if total_required > total_available:
-                return False
+        # Demanda e oferta por item somadas de uma vez sobre as linhas
+        # selecionadas (matriz densa ou esparsa, conforme a instância)
+        demand = self.orders_matrix[selected_orders].sum(axis=0)
+        supply = self.aisles_matrix[visited_aisles].sum(axis=0)
+        return bool((demand <= supply).all())
 
-        return True
+    @staticmethod
+    def _in_range(indices, size):
+        # O kernel não checa limites; índices negativos ou fora da faixa seguem
+        # pelo caminho NumPy (que os trata como o indexamento de listas)
+        return indices.size == 0 or (indices.min() >= 0 and indices.max() < size)
 
     def compute_objective_function(self, selected_orders, visited_aisles):
-        total_units_picked = 0
-        for order in selected_orders:
-            total_units_picked += np.sum(list(self.orders[order].values()))
-        
+        selected_orders = np.asarray(selected_orders, dtype=np.intp)
+        total_units_picked = int(self.order_totals[selected_orders].sum())
+
         num_visited_aisles = len(visited_aisles)
+        if num_visited_aisles == 0 and len(selected_orders) > 0:
+            return float('inf')  # como na divisão de inteiros NumPy por zero
         return total_units_picked / num_visited_aisles
 
+def txt_files(directory):
+    with os.scandir(directory) as entries:
+        return [entry.name for entry in entries if entry.name.endswith('.txt') and entry.is_file()]
+
 def check_all_files(input_dir="datasets/b", output_dir="output"):
     wave_order_picking = WaveOrderPicking()
     
     # Obter lista de arquivos de entrada e saída
-    input_files = [f for f in os.listdir(input_dir) if f.endswith('.txt')]
-    output_files = [f for f in os.listdir(output_dir) if f.endswith('.txt')]
+    input_files = txt_files(input_dir)
+    output_files = set(txt_files(output_dir))
     
     # Para cada par correspondente
     for input_file in input_files:
@@ -122,10 +260,10 @@ if __name__ == "__main__":
         selected_orders, visited_aisles = wave_order_picking.read_output(sys.argv[2])
         
         is_feasible = wave_order_picking.is_solution_feasible(selected_orders, visited_aisles)
-        objective_value = wave_order_picking.compute_objective_function(selected_orders, visited_aisles)
         
         print("É factível:", is_feasible)
         if is_feasible:
+            objective_value = wave_order_picking.compute_objective_function(selected_orders, visited_aisles)
             print("Valor da função objetivo:", objective_value)
     else:
         print("Uso: python checker.py [<input_file> <output_file>]")
@@ -3,7 +3,9 @@ import subprocess
 import sys
 import platform
 import signal
-from subprocess import Popen, PIPE
+import time
+from multiprocessing.pool import ThreadPool
+from subprocess import Popen
 
 # Paths to the libraries
 CPLEX_PATH = "/home/scarletflexsim/cplex/cplex/bin/x86-64_linux"
@@ -13,6 +15,8 @@ USE_CPLEX = True
 USE_OR_TOOLS = False  
 
 MAX_RUNNING_TIME = 605  # em segundos
+MAX_PARALLEL_RUNS = 1  # instâncias executadas simultaneamente
+VERBOSE = os.environ.get("VERBOSE") == "1"  # mensagens de progresso por instância
 
 def compile_code(source_folder):
     print(f"Compilando código em {source_folder}...")
@@ -32,15 +36,58 @@ def compile_code(source_folder):
     print("Compilação Maven bem sucedida.")
     return True
 
-def run_with_timeout(cmd, timeout_sec):
-    process = Popen(cmd, stdout=PIPE, stderr=PIPE)
+def run_with_timeout(cmd, timeout_sec, log_file):
+    # stdout/stderr vão direto para o arquivo de log (sem acumular em memória);
+    # o processo roda em nova sessão para que o timeout encerre o grupo inteiro,
+    # primeiro com SIGTERM (deixa o CPLEX finalizar) e depois com SIGKILL
+    posix = hasattr(os, "killpg")
+    with open(log_file, "wb") as log:
+        process = Popen(cmd, stdout=log, stderr=subprocess.STDOUT, start_new_session=posix)
+        try:
+            return process.wait(timeout=timeout_sec), b""
+        except subprocess.TimeoutExpired:
+            terminate(process, posix)
+            return -1, f"Timeout: processo encerrado após {timeout_sec} segundos".encode()
+        except BaseException:
+            # fora do grupo do terminal o Ctrl-C não chega à JVM: encerra
+            # antes de propagar para não deixar o processo órfão
+            if process.poll() is None:
+                terminate(process, posix)
+            raise
+
+def terminate(process, posix, grace_sec=5):
+    if not posix:
+        process.kill()
+        process.wait()
+        return
+    os.killpg(process.pid, signal.SIGTERM)
     try:
-        stdout, stderr = process.communicate(timeout=timeout_sec)
-        return process.returncode, stdout, stderr
+        process.wait(timeout=grace_sec)
     except subprocess.TimeoutExpired:
-        process.kill()
-        print(f"Processo encerrado após {timeout_sec} segundos")
-        return -1, b"", b"Timeout"
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+
+def log_tail(log_file, max_bytes=4096):
+    with open(log_file, "rb") as log:
+        log.seek(max(0, os.path.getsize(log_file) - max_bytes))
+        return log.read()
+
+def run_instance(task):
+    # As mensagens são acumuladas e devolvidas ao processo principal, que é o
+    # único a escrever no stdout (sem disputa nem saída intercalada entre workers)
+    input_file, output_file, cmd = task
+    log_file = output_file + ".log"
+    messages = []
+    start = time.perf_counter()
+    with open(output_file, "w") as out:
+        returncode, error = run_with_timeout(cmd, MAX_RUNNING_TIME, log_file)
+        if VERBOSE:
+            elapsed = time.perf_counter() - start
+            messages.append(f"Executado {os.path.basename(input_file)} em {elapsed:.1f} s")
+        if returncode != 0:
+            messages.append(f"Falha na execução para {input_file}:")
+            messages.append((error or log_tail(log_file)).decode('utf-8', errors='ignore'))
+    return "\n".join(messages)
 
 def run_benchmark(source_folder, input_folder, output_folder):
     # Change to the source folder
@@ -57,29 +104,40 @@ def run_benchmark(source_folder, input_folder, output_folder):
     elif USE_OR_TOOLS:
         libraries = OR_TOOLS_PATH
 
-    for filename in os.listdir(input_folder):
-        if filename.endswith(".txt"):
-            input_file = os.path.join(input_folder, filename)
-            output_file = os.path.join(output_folder, f"{os.path.splitext(filename)[0]}.txt")
+    with os.scandir(output_folder) as entries:
+        solved = {entry.name for entry in entries}
+
+    tasks = []
+    with os.scandir(input_folder) as entries:
+        for entry in entries:
+            if not (entry.name.endswith(".txt") and entry.is_file()):
+                continue
+            filename = entry.name
+            input_file = entry.path
+            output_file = os.path.join(output_folder, filename)
 
             # Verifica se a saída já existe
-            if os.path.exists(output_file):
-                print(f"{filename} já foi resolvido. Pulando...")
+            if filename in solved:
+                if VERBOSE:
+                    print(f"{filename} já foi resolvido. Pulando...")
                 continue
 
-            print(f"Executando {filename}")
-            with open(output_file, "w") as out:
-                # Main Java command
-                cmd = ["java", "-Xmx16g", "-jar", "target/ChallengeSBPO2025-1.0.jar",
-                      input_file,
-                      output_file]
-                if USE_CPLEX or USE_OR_TOOLS:
-                    cmd.insert(1, f"-Djava.library.path={libraries}")
-
-                returncode, stdout, stderr = run_with_timeout(cmd, MAX_RUNNING_TIME)
-                if returncode != 0:
-                    print(f"Falha na execução para {input_file}:")
-                    print(stderr.decode('utf-8', errors='ignore'))
+            # Main Java command
+            cmd = ["java", "-Xmx16g", "-jar", "target/ChallengeSBPO2025-1.0.jar",
+                  input_file,
+                  output_file]
+            if USE_CPLEX or USE_OR_TOOLS:
+                cmd.insert(1, f"-Djava.library.path={libraries}")
+            tasks.append((entry.stat().st_size, (input_file, output_file, cmd)))
+
+    # Maiores instâncias primeiro (longest-processing-time first): com várias
+    # execuções simultâneas, cada worker pega a próxima instância ao terminar
+    tasks.sort(key=lambda task: task[0], reverse=True)
+    tasks = [task for _, task in tasks]
+    with ThreadPool(MAX_PARALLEL_RUNS) as pool:
+        for messages in pool.imap_unordered(run_instance, tasks, chunksize=1):
+            if messages:
+                print(messages, flush=True)
 
 if __name__ == "__main__":
     if len(sys.argv) != 4:
@@ -2,11 +2,12 @@ package org.sbpo2025.challenge;
 
 import org.apache.commons.lang3.time.StopWatch;
 
-import java.io.BufferedReader;
-import java.io.BufferedWriter;
-import java.io.FileReader;
-import java.io.FileWriter;
 import java.io.IOException;
+import java.nio.ByteBuffer;
+import java.nio.channels.FileChannel;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardOpenOption;
 import java.util.ArrayList;
 import java.util.HashMap;
 import java.util.List;
@@ -22,12 +23,10 @@ public class Challenge {
 
     public void readInput(String inputFilePath) {
         try {
-            BufferedReader reader = new BufferedReader(new FileReader(inputFilePath));
-            String line = reader.readLine();
-            String[] firstLine = line.split(" ");
-            int nOrders = Integer.parseInt(firstLine[0]);
-            int nItems = Integer.parseInt(firstLine[1]);
-            int nAisles = Integer.parseInt(firstLine[2]);
+            IntScanner scanner = new IntScanner(mapFile(inputFilePath));
+            int nOrders = scanner.nextInt();
+            int nItems = scanner.nextInt();
+            int nAisles = scanner.nextInt();
 
             // Initialize orders and aisles arrays
             orders = new ArrayList<>(nOrders);
@@ -35,71 +34,93 @@ public class Challenge {
             this.nItems = nItems;
 
             // Read orders
-            readItemQuantityPairs(reader, nOrders, orders);
+            readItemQuantityPairs(scanner, nOrders, orders);
 
             // Read aisles
-            readItemQuantityPairs(reader, nAisles, aisles);
+            readItemQuantityPairs(scanner, nAisles, aisles);
 
             // Read wave size bounds
-            line = reader.readLine();
-            String[] bounds = line.split(" ");
-            waveSizeLB = Integer.parseInt(bounds[0]);
-            waveSizeUB = Integer.parseInt(bounds[1]);
-
-            reader.close();
+            waveSizeLB = scanner.nextInt();
+            waveSizeUB = scanner.nextInt();
         } catch (IOException e) {
             System.err.println("Error reading input from " + inputFilePath);
             e.printStackTrace();
         }
     }
 
-    private void readItemQuantityPairs(BufferedReader reader, int nLines, List<Map<Integer, Integer>> orders) throws IOException {
-        String line;
+    private void readItemQuantityPairs(IntScanner scanner, int nLines, List<Map<Integer, Integer>> orders) {
         for (int orderIndex = 0; orderIndex < nLines; orderIndex++) {
-            line = reader.readLine();
-            String[] orderLine = line.split(" ");
-            int nOrderItems = Integer.parseInt(orderLine[0]);
-            Map<Integer, Integer> orderMap = new HashMap<>();
+            int nOrderItems = scanner.nextInt();
+            Map<Integer, Integer> orderMap = new HashMap<>(2 * nOrderItems);
             for (int k = 0; k < nOrderItems; k++) {
-                int itemIndex = Integer.parseInt(orderLine[2 * k + 1]);
-                int itemQuantity = Integer.parseInt(orderLine[2 * k + 2]);
+                int itemIndex = scanner.nextInt();
+                int itemQuantity = scanner.nextInt();
                 orderMap.put(itemIndex, itemQuantity);
             }
             orders.add(orderMap);
         }
     }
 
+    // Maps the input file read-only into memory, so the scanner works on the
+    // page cache directly instead of a heap copy of the whole file
+    private static ByteBuffer mapFile(String path) throws IOException {
+        try (FileChannel channel = FileChannel.open(Path.of(path), StandardOpenOption.READ)) {
+            return channel.map(FileChannel.MapMode.READ_ONLY, 0, channel.size());
+        }
+    }
+
+    // Reads whitespace-separated integers directly from the raw file bytes.
+    // Every line of the instance starts with its own length, so the file can be
+    // consumed as a single token stream with no per-line or per-token Strings.
+    private static final class IntScanner {
+        private final ByteBuffer buffer;
+        private final int limit;
+        private int position = 0;
+
+        IntScanner(ByteBuffer buffer) {
+            this.buffer = buffer;
+            this.limit = buffer.limit();
+        }
+
+        int nextInt() {
+            while (position < limit && buffer.get(position) <= ' ') position++;
+            boolean negative = position < limit && buffer.get(position) == '-';
+            if (negative) position++;
+            int value = 0;
+            byte b;
+            while (position < limit && (b = buffer.get(position)) > ' ') {
+                value = 10 * value + (b - '0');
+                position++;
+            }
+            return negative ? -value : value;
+        }
+    }
+
     public void writeOutput(ChallengeSolution challengeSolution, String outputFilePath) {
         if (challengeSolution == null) {
             System.err.println("Solution not found");
             return;
         }
         try {
-            BufferedWriter writer = new BufferedWriter(new FileWriter(outputFilePath));
             var orders = challengeSolution.orders();
             var aisles = challengeSolution.aisles();
 
-            // Write the number of orders
-            writer.write(String.valueOf(orders.size()));
-            writer.newLine();
+            // Build the whole file in memory and write it with a single call
+            StringBuilder output = new StringBuilder(8 * (orders.size() + aisles.size() + 2));
 
-            // Write each order
+            // Write the number of orders and each order
+            output.append(orders.size()).append('\n');
             for (int order : orders) {
-                writer.write(String.valueOf(order));
-                writer.newLine();
+                output.append(order).append('\n');
             }
 
-            // Write the number of aisles
-            writer.write(String.valueOf(aisles.size()));
-            writer.newLine();
-
-            // Write each aisle
+            // Write the number of aisles and each aisle
+            output.append(aisles.size()).append('\n');
             for (int aisle : aisles) {
-                writer.write(String.valueOf(aisle));
-                writer.newLine();
+                output.append(aisle).append('\n');
             }
 
-            writer.close();
+            Files.writeString(Path.of(outputFilePath), output);
             System.out.println("Output written to " + outputFilePath);
 
         } catch (IOException e) {
@@ -35,38 +35,68 @@ public class ChallengeSolver {
         Set<Integer> bestCorridors = null;  // melhor conjunto de corredores
         Random rng = new Random(2112);      // gerador de números aleatórios
 
-        // reinícios da heurística multistart
-        for (int r = 0; r < MAX_RESTARTS && remainingTimeMs() > 2_000; r++) {
-            
+        // os modelos são criados uma única vez e reaproveitados por todos os
+        // reinícios (um único ambiente CPLEX por execução)
+        if (data.corridorCount <= 20) {
             // abordagem por enumeração para problemas pequenos
-            if (data.corridorCount <= 20) {
-                for (int k = 1; k <= data.corridorCount && remainingTimeMs() > 2_000; k++) {
-                    IloResult res = solveFixedCorridorCount(k, remainingTimeMs());
-                    if (res.feasible && res.ratio > bestRatio) {
-                        bestRatio     = res.ratio;
-                        bestOrders    = res.chosenOrders;
-                        bestCorridors = res.chosenCorridors;
+            // (um único modelo para todos os k: só o lado direito muda)
+            try (FixedCorridorModel model = new FixedCorridorModel()) {
+                // limitante de v_k válido para todo k (ver itemsUpperBound); é
+                // opcional: se o LP falhar, a varredura segue sem ele
+                double itemsBound;
+                try { itemsBound = model.itemsUpperBound(remainingTimeMs()); }
+                catch (IloException ex) { itemsBound = Double.POSITIVE_INFINITY; }
+                // limitantes combinatórios por k, sem resolver nenhum LP
+                long[] pickable = data.pickableItemsByCorridorCount();
+                long[] topTotals = data.topCorridorTotalsByCorridorCount();
+
+                // reinícios da heurística multistart
+                for (int r = 0; r < MAX_RESTARTS && remainingTimeMs() > 2_000; r++) {
+                    for (int k = 1; k <= data.corridorCount && remainingTimeMs() > 2_000; k++) {
+                        // v_k <= itemsBound para todo k: se itemsBound / k já não
+                        // supera a melhor razão, nenhum k' >= k pode superar (inclui o
+                        // caso em que a onda saturou no limite superior)
+                        if (itemsBound / k <= bestRatio) break;
+
+                        // nem os k corredores mais fartos, nem as k melhores ofertas
+                        // de cada item alcançam o mínimo da onda (k inviável) ou
+                        // superam a melhor razão: pula o MIP
+                        long kBound = Math.min(pickable[k], topTotals[k]);
+                        if (kBound < data.minWaveItems || (double) kBound / k <= bestRatio) continue;
+
+                        IloResult res = model.solve(k, remainingTimeMs(), bestRatio);
+                        if (res.feasible && res.ratio > bestRatio) {
+                            bestRatio     = res.ratio;
+                            bestOrders    = res.chosenOrders;
+                            bestCorridors = res.chosenCorridors;
+                        }
                     }
                 }
-            } else {
-                // abordagem de Dinkelbach para problemas grandes
-                double lambda = rng.nextDouble() * data.maxWaveItems;
-                for (int it = 0; it < 50 && remainingTimeMs() > 2_000; it++) {
-                    IloResult res = solveLambda(lambda, remainingTimeMs());
-                    if (!res.feasible) break;
-
-                    if (res.ratio > bestRatio) {
-                        bestRatio     = res.ratio;
-                        bestOrders    = res.chosenOrders;
-                        bestCorridors = res.chosenCorridors;
-                    }
-                    if (res.corridorsUsed == 0) break;
+            } catch (IloException ex) { /* sem modelo: retorna a melhor solução até aqui */ }
+        } else {
+            // abordagem de Dinkelbach para problemas grandes
+            // (mesmo modelo em todas as iterações: só o objetivo muda)
+            try (LambdaModel model = new LambdaModel()) {
+                // reinícios da heurística multistart
+                for (int r = 0; r < MAX_RESTARTS && remainingTimeMs() > 2_000; r++) {
+                    double lambda = rng.nextDouble() * data.maxWaveItems;
+                    for (int it = 0; it < 50 && remainingTimeMs() > 2_000; it++) {
+                        IloResult res = model.solve(lambda, remainingTimeMs());
+                        if (!res.feasible) break;
+
+                        if (res.ratio > bestRatio) {
+                            bestRatio     = res.ratio;
+                            bestOrders    = res.chosenOrders;
+                            bestCorridors = res.chosenCorridors;
+                        }
+                        if (res.corridorsUsed == 0) break;
 
-                    double newLambda = (double) res.totalItems / res.corridorsUsed;
-                    if (Math.abs(newLambda - lambda) < 1e-3) break;
-                    lambda = newLambda;
+                        double newLambda = (double) res.totalItems / res.corridorsUsed;
+                        if (Math.abs(newLambda - lambda) < 1e-3) break;
+                        lambda = newLambda;
+                    }
                 }
-            }
+            } catch (IloException ex) { /* sem modelo: retorna a melhor solução até aqui */ }
         }
 
         // retorno da melhor solução encontrada
@@ -76,100 +106,303 @@ public class ChallengeSolver {
     }
 
     // ======================= MODELO COM k FIXO =======================
-    private IloResult solveFixedCorridorCount(int k, long timeMs) {
-        try (IloCplex c = new IloCplex()) {
-            c.setOut(null);
-            c.setParam(IloCplex.Param.TimeLimit, timeMs / 1000.0);
-            setThreads(c);
+    // construído uma vez e reotimizado para cada k: entre resoluções só muda o
+    // lado direito da restrição de corredores, então a base e a solução anterior
+    // continuam válidas como ponto de partida
+    private final class FixedCorridorModel implements AutoCloseable {
+        private final IloCplex c;
+        private final IloNumVar[] x, y;
+        private final IloRange corridorLimit;
+        private final RatioCutoff cutoff = new RatioCutoff();
+        private final RelaxedCorridorModel relaxation;
+        private IloResult last = null; // última solução viável (MIP start do próximo k)
+        private final Map<Integer,IloResult> solved = new HashMap<>(); // resultados já obtidos por k
+
+        FixedCorridorModel() throws IloException {
+            relaxation = new RelaxedCorridorModel();
+            try {
+                c = new IloCplex();
+            } catch (IloException ex) {
+                relaxation.close();
+                throw ex;
+            }
+            try {
+                c.setOut(null);
+                setMipParams(c); // antes dos demais: readParam restaura os padrões
+                c.setParam(IloCplex.Param.Advance, 1);                              // reaproveita base/incumbente
+                c.setParam(IloCplex.Param.RootAlgorithm, IloCplex.Algorithm.Dual); // dual simplex após mudar o RHS
+                setThreads(c);
+
+                // variáveis de decisão
+                x = c.boolVarArray(data.orderCount);
+                y = c.boolVarArray(data.corridorCount);
+
+                // restrição de quantidade total de itens
+                IloLinearNumExpr items = addWaveConstraints(c, x);
+
+                // restrições de capacidade
+                addCapacityConstraints(c, x, y);
+
+                // restrição: número exato de corredores usados = k (RHS ajustado em solve)
+                corridorLimit = addCorridorCount(c, y);
+
+                // objetivo: maximizar quantidade de itens
+                c.addMaximize(items);
+
+                c.use(cutoff);
+            } catch (IloException ex) {
+                c.end();
+                relaxation.close();
+                throw ex;
+            }
+        }
 
-            // variáveis de decisão
-            IloNumVar[] x = boolArray(c, data.orderCount,  "o");
-            IloNumVar[] y = boolArray(c, data.corridorCount,"a");
+        IloResult solve(int k, long timeMs, double bestRatio) {
+            IloResult known = solved.get(k);
+            if (known != null) return known;
+            try {
+                c.setParam(IloCplex.Param.TimeLimit, timeMs / 1000.0);
+                corridorLimit.setBounds(k, k);
+                cutoff.k         = k;
+                cutoff.bestRatio = bestRatio;
+
+                // a relaxação linear já mostra que k é inviável ou que não
+                // melhora a razão: pula o MIP
+                double lpBound = relaxation.bound(k, timeMs);
+                if (lpBound == Double.NEGATIVE_INFINITY
+                        || (bestRatio > 0 && lpBound / k <= bestRatio * (1 + 1e-9))) {
+                    solved.put(k, IloResult.infeasible());
+                    return IloResult.infeasible();
+                }
 
-            // restrição de quantidade total de itens
-            IloLinearNumExpr items = c.linearNumExpr();
-            for (int o = 0; o < data.orderCount; o++)
-                items.addTerm(data.itemsPerOrder[o], x[o]);
-            c.addGe(items, data.minWaveItems);
-            c.addLe(items, data.maxWaveItems);
+                // descarta os starts do k anterior e fornece os novos
+                if (c.getNMIPStarts() > 0) c.deleteMIPStarts(0, c.getNMIPStarts());
+                warmStart(c, x, y, k);
+                if (last != null) previousStart(k);
 
-            // restrições de capacidade
-            addCapacityConstraints(c, x, y);
+                // resolução
+                if (!c.solve() || !(c.getStatus() == IloCplex.Status.Optimal || c.getStatus() == IloCplex.Status.Feasible))
+                    return remember(k, IloResult.infeasible());
 
-            // restrição: número exato de corredores usados = k
-            IloLinearNumExpr corrExpr = c.linearNumExpr();
-            for (IloNumVar v : y) corrExpr.addTerm(1, v);
-            c.addEq(corrExpr, k);
+                // a estrutura é a mesma para todos os k: depois da primeira
+                // resolução o presolve só refaria as mesmas reduções
+                c.setParam(IloCplex.Param.Preprocessing.Presolve, false);
 
-            // objetivo: maximizar quantidade de itens
-            c.addMaximize(items);
+                last = extractResult(c, x, y);
+                return remember(k, last);
+            } catch (IloException ex) { return IloResult.infeasible(); }
+        }
 
-            // solução inicial gulosa
-            warmStart(c, x, y, k);
+        // memoriza o resultado de k para os reinícios seguintes, exceto se a
+        // resolução parou por tempo; resultados podados pela razão continuam
+        // válidos, pois a melhor razão só cresce
+        private IloResult remember(int k, IloResult res) throws IloException {
+            if (c.getCplexStatus() != IloCplex.CplexStatus.AbortTimeLim) solved.put(k, res);
+            return res;
+        }
 
-            // resolução
-            if (!c.solve() || !(c.getStatus() == IloCplex.Status.Optimal || c.getStatus() == IloCplex.Status.Feasible))
-                return IloResult.infeasible();
+        // v_k é não decrescente em k (mais corredores só aumentam a oferta), então
+        // o LP com todos os corredores limita v_k para qualquer k; -inf se nem
+        // com todos os corredores há solução
+        double itemsUpperBound(long timeMs) throws IloException {
+            double lp = relaxation.bound(data.corridorCount, timeMs);
+            return Math.min(data.maxWaveItems, Math.floor(lp + 1e-6));
+        }
+
+        // solução do k anterior + um corredor extra: continua viável, pois mais
+        // corredores só aumentam a oferta
+        private void previousStart(int k) throws IloException {
+            if (last.chosenCorridors.size() >= k) return;
+            boolean[] aSel = new boolean[data.corridorCount];
+            for (int a : last.chosenCorridors) aSel[a] = true;
+            int missing = k - last.chosenCorridors.size();
+            for (int a = 0; a < aSel.length && missing > 0; a++)
+                if (!aSel[a]) { aSel[a] = true; missing--; }
+
+            int n = x.length + y.length;
+            IloNumVar[] vars = new IloNumVar[n];
+            double[]     val = new double[n];
+            int p = 0;
+            for (int i = 0; i < x.length; i++) { vars[p] = x[i]; val[p++] = last.chosenOrders.contains(i) ? 1 : 0; }
+            for (int i = 0; i < y.length; i++) { vars[p] = y[i]; val[p++] = aSel[i] ? 1 : 0; }
+
+            c.addMIPStart(vars, val, IloCplex.MIPStartEffort.CheckFeas, "previous");
+        }
 
-            return extractResult(c, x, y, items);
-        } catch (IloException ex) { return IloResult.infeasible(); }
+        @Override
+        public void close() {
+            c.end();
+            relaxation.close();
+        }
     }
 
-    // ======================= MODELO COM LAMBDA =======================
-    private IloResult solveLambda(double lambda, long timeMs) {
-        try (IloCplex c = new IloCplex()) {
-            c.setOut(null);
+    // relaxação linear do modelo com k fixo, mantida ao lado dele: só o RHS da
+    // restrição de corredores muda entre os k, e o LP ótimo é um limitante
+    // superior barato para o número de itens v_k
+    private final class RelaxedCorridorModel implements AutoCloseable {
+        private final IloCplex c;
+        private final IloRange corridorLimit;
+
+        RelaxedCorridorModel() throws IloException {
+            c = new IloCplex();
+            try {
+                c.setOut(null);
+                c.setParam(IloCplex.Param.RootAlgorithm, IloCplex.Algorithm.Dual);
+                setThreads(c);
+
+                IloNumVar[] x = c.numVarArray(data.orderCount,    0, 1);
+                IloNumVar[] y = c.numVarArray(data.corridorCount, 0, 1);
+
+                IloLinearNumExpr items = addWaveConstraints(c, x);
+                addCapacityConstraints(c, x, y);
+                corridorLimit = addCorridorCount(c, y);
+                c.addMaximize(items);
+            } catch (IloException ex) {
+                c.end();
+                throw ex;
+            }
+        }
+
+        // limitante superior de v_k: -inf se o LP é inviável (o MIP também é)
+        // e +inf se o LP não terminou (sem poda)
+        double bound(int k, long timeMs) throws IloException {
             c.setParam(IloCplex.Param.TimeLimit, timeMs / 1000.0);
-            c.setParam(IloCplex.Param.Emphasis.MIP, 1);
-            setThreads(c);
+            corridorLimit.setBounds(k, k);
+            if (c.solve() && c.getStatus() == IloCplex.Status.Optimal) return c.getObjValue();
+            return c.getStatus() == IloCplex.Status.Infeasible ? Double.NEGATIVE_INFINITY : Double.POSITIVE_INFINITY;
+        }
 
-            IloNumVar[] x = boolArray(c, data.orderCount,  "o");
-            IloNumVar[] y = boolArray(c, data.corridorCount,"a");
+        @Override
+        public void close() { c.end(); }
+    }
 
-            IloLinearNumExpr items = c.linearNumExpr();
-            for (int o = 0; o < data.orderCount; o++)
-                items.addTerm(data.itemsPerOrder[o], x[o]);
-            c.addGe(items, data.minWaveItems);
-            c.addLe(items, data.maxWaveItems);
+    // interrompe a busca assim que o limitante superior dividido por k não
+    // supera a melhor razão já encontrada: nenhuma solução com k corredores
+    // pode melhorar o resultado
+    private static final class RatioCutoff extends IloCplex.MIPInfoCallback {
+        int    k;
+        double bestRatio;
+
+        @Override
+        protected void main() throws IloException {
+            if (bestRatio > 0 && getBestObjValue() / k <= bestRatio * (1 + 1e-9)) abort();
+        }
+    }
+
+    // ======================= MODELO COM LAMBDA =======================
+    // construído uma vez por execução: a cada iteração de Dinkelbach só os
+    // coeficientes de y no objetivo (-lambda) são trocados, de modo que o
+    // modelo pré-resolvido e a incumbente da iteração anterior são reaproveitados
+    private final class LambdaModel implements AutoCloseable {
+        private final IloCplex c;
+        private final IloNumVar[] x, y;
+        private final IloObjective obj;
+
+        LambdaModel() throws IloException {
+            c = new IloCplex();
+            try {
+                c.setOut(null);
+                setMipParams(c); // antes dos demais: readParam restaura os padrões
+                c.setParam(IloCplex.Param.Advance, 1); // mantém a incumbente entre iterações
+                setThreads(c);
+
+                x = c.boolVarArray(data.orderCount);
+                y = c.boolVarArray(data.corridorCount);
+
+                IloLinearNumExpr items = addWaveConstraints(c, x);
+
+                addCapacityConstraints(c, x, y);
+
+                // objetivo modificado por Dinkelbach: itens - lambda * corredores
+                // (coeficientes de y definidos em solve)
+                obj = c.addMaximize(items);
+
+                // a solução gulosa não depende de lambda: basta fornecê-la uma vez
+                warmStart(c, x, y, -1);
+            } catch (IloException ex) {
+                c.end();
+                throw ex;
+            }
+        }
 
-            addCapacityConstraints(c, x, y);
+        IloResult solve(double lambda, long timeMs) {
+            try {
+                c.setParam(IloCplex.Param.TimeLimit, timeMs / 1000.0);
 
-            // objetivo modificado por Dinkelbach
-            IloLinearNumExpr obj = c.linearNumExpr();
-            for (int o = 0; o < data.orderCount;   o++) obj.addTerm(data.itemsPerOrder[o], x[o]);
-            for (int a = 0; a < data.corridorCount; a++) obj.addTerm(-lambda, y[a]);
-            c.addMaximize(obj);
+                double[] coef = new double[y.length];
+                Arrays.fill(coef, -lambda);
+                c.setLinearCoefs(obj, coef, y);
 
-            warmStart(c, x, y, -1);
+                if (!c.solve() || !(c.getStatus() == IloCplex.Status.Optimal || c.getStatus() == IloCplex.Status.Feasible))
+                    return IloResult.infeasible();
 
-            if (!c.solve() || !(c.getStatus() == IloCplex.Status.Optimal || c.getStatus() == IloCplex.Status.Feasible))
-                return IloResult.infeasible();
+                // além da incumbente, o pool guarda as soluções encontradas na
+                // árvore, com números de corredores variados: fica com a de
+                // melhor razão real
+                IloResult best = extractResult(c, x, y);
+                for (int s = 0; s < c.getSolnPoolNsolns(); s++) {
+                    IloResult res = extractResult(c, x, y, s);
+                    if (res.ratio > best.ratio) best = res;
+                }
+                return best;
+            } catch (IloException ex) { return IloResult.infeasible(); }
+        }
 
-            return extractResult(c, x, y, items);
-        } catch (IloException ex) { return IloResult.infeasible(); }
+        @Override
+        public void close() { c.end(); }
     }
 
     // ======================= UTILITARIOS =======================
-    private static IloNumVar[] boolArray(IloCplex c, int n, String p) throws IloException {
-        IloNumVar[] v = new IloNumVar[n];
-        for (int i = 0; i < n; i++) v[i] = c.boolVar(p + "_" + i);
-        return v;
+    // restrição de quantidade total de itens como uma única linha com
+    // limites lb <= itens <= ub; devolve a expressão para ser reaproveitada
+    // no objetivo
+    private IloLinearNumExpr addWaveConstraints(IloCplex c, IloNumVar[] x) throws IloException {
+        IloLinearNumExpr items = c.scalProd(Arrays.stream(data.itemsPerOrder).asDoubleStream().toArray(), x);
+        c.addRange(data.minWaveItems, items, data.maxWaveItems);
+        return items;
+    }
+
+    // restrição sum(y) = k, com k ajustado depois via setBounds
+    private static IloRange addCorridorCount(IloCplex c, IloNumVar[] y) throws IloException {
+        double[] ones = new double[y.length];
+        Arrays.fill(ones, 1);
+        return c.addEq(c.scalProd(ones, y), 1);
     }
 
+    // restrições de capacidade em forma matricial: uma linha por item com
+    // demanda (sum q*x - sum s*y <= 0), adicionadas de uma vez via IloLPMatrix
     private void addCapacityConstraints(IloCplex c, IloNumVar[] x, IloNumVar[] y) throws IloException {
+        IloLPMatrix lp = c.addLPMatrix();
+        lp.addCols(x); // colunas 0 .. orderCount-1
+        lp.addCols(y); // colunas orderCount .. orderCount+corridorCount-1
+
+        int rows = 0;
+        for (int i = 0; i < data.itemCount; i++)
+            if (data.itemOrderStart[i + 1] > data.itemOrderStart[i] && !data.impliedItem[i]) rows++;
+
+        double[]   lb  = new double[rows];
+        double[]   ub  = new double[rows];
+        int[][]    ind = new int[rows][];
+        double[][] val = new double[rows][];
+        int r = 0;
         for (int i = 0; i < data.itemCount; i++) {
-            if (data.ordersRequiringItem[i].isEmpty()) continue;
-
-            IloLinearNumExpr demand = c.linearNumExpr();
-            for (int o : data.ordersRequiringItem[i])
-                demand.addTerm(data.orderDemand.get(o).get(i), x[o]);
-
-            IloLinearNumExpr supply = c.linearNumExpr();
-            for (int a : data.corridorsContainingItem[i])
-                supply.addTerm(data.corridorSupply.get(a).get(i), y[a]);
-
-            c.addLe(demand, supply);
+            int o0 = data.itemOrderStart[i],    o1 = data.itemOrderStart[i + 1];
+            int a0 = data.itemCorridorStart[i], a1 = data.itemCorridorStart[i + 1];
+            if (o1 == o0 || data.impliedItem[i]) continue;
+
+            int[]    idx = new int[(o1 - o0) + (a1 - a0)];
+            double[] v   = new double[idx.length];
+            int p = 0;
+            for (int k = o0; k < o1; k++) { idx[p] = data.itemOrders[k];                      v[p++] =  data.itemOrderQty[k]; }
+            for (int k = a0; k < a1; k++) { idx[p] = data.orderCount + data.itemCorridors[k]; v[p++] = -data.itemCorridorQty[k]; }
+
+            lb[r]  = -Double.MAX_VALUE;
+            ub[r]  = 0;
+            ind[r] = idx;
+            val[r] = v;
+            r++;
         }
+        lp.addRows(lb, ub, ind, val);
     }
 
     private void setThreads(IloCplex c) throws IloException {
@@ -180,6 +413,24 @@ public class ChallengeSolver {
         }
     }
 
+    // parâmetros ajustados à estrutura do problema (mochila 0/1 com cobertura):
+    // ênfase em viabilidade, simetria agressiva entre corredores, heurísticas
+    // mais frequentes e cortes de cobertura agressivos. Um arquivo .prm (por
+    // exemplo, gerado pelo tuning tool do CPLEX) indicado em CPLEX_PARAM_FILE
+    // substitui esse ajuste. readParam volta aos padrões todo parâmetro fora do
+    // arquivo, então deve ser chamado antes de Threads/Advance/RootAlgorithm
+    private void setMipParams(IloCplex c) throws IloException {
+        String f = System.getenv("CPLEX_PARAM_FILE");
+        if (f != null && !f.isBlank()) {
+            c.readParam(f.trim());
+            return;
+        }
+        c.setParam(IloCplex.Param.Emphasis.MIP, 1);
+        c.setParam(IloCplex.Param.Preprocessing.Symmetry, 2);
+        c.setParam(IloCplex.Param.MIP.Strategy.HeuristicFreq, 10);
+        c.setParam(IloCplex.Param.MIP.Cuts.Covers, 2);
+    }
+
     // solução inicial gulosa
     private void warmStart(IloCplex c, IloNumVar[] x, IloNumVar[] y, int corrLimit) throws IloException {
         boolean[] oSel = new boolean[data.orderCount];
@@ -234,13 +485,23 @@ public class ChallengeSolver {
         c.addMIPStart(vars, val, IloCplex.MIPStartEffort.Auto, "warm");
     }
 
-    private IloResult extractResult(IloCplex c, IloNumVar[] x, IloNumVar[] y, IloLinearNumExpr itemsExpr) throws IloException {
+    // valores lidos em lote (uma chamada por vetor) e itens somados a partir de x
+    private IloResult extractResult(IloCplex c, IloNumVar[] x, IloNumVar[] y) throws IloException {
+        return toResult(c.getValues(x), c.getValues(y));
+    }
+
+    // idem para a solução de índice soln do pool
+    private IloResult extractResult(IloCplex c, IloNumVar[] x, IloNumVar[] y, int soln) throws IloException {
+        return toResult(c.getValues(x, soln), c.getValues(y, soln));
+    }
+
+    private IloResult toResult(double[] xv, double[] yv) {
         Set<Integer> ord = new HashSet<>();
         Set<Integer> ais = new HashSet<>();
-        for (int o = 0; o < x.length; o++) if (c.getValue(x[o]) > 0.5) ord.add(o);
-        for (int a = 0; a < y.length; a++) if (c.getValue(y[a]) > 0.5) ais.add(a);
+        int items = 0;
+        for (int o = 0; o < xv.length; o++) if (xv[o] > 0.5) { ord.add(o); items += data.itemsPerOrder[o]; }
+        for (int a = 0; a < yv.length; a++) if (yv[a] > 0.5) ais.add(a);
 
-        int items = (int) Math.round(c.getValue(itemsExpr));
         int corrs = ais.size();
         double ratio = corrs == 0 ? 0.0 : (double) items / corrs;
         return new IloResult(true, ratio, items, corrs, ord, ais);
@@ -262,6 +523,13 @@ public class ChallengeSolver {
         final List<Integer>[] ordersRequiringItem;
         final List<Integer>[] corridorsContainingItem;
 
+        // índices item -> (pedido, qtd) e item -> (corredor, qtd) em formato CSR
+        final int[] itemOrderStart,    itemOrders,    itemOrderQty;
+        final int[] itemCorridorStart, itemCorridors, itemCorridorQty;
+
+        // itens cuja restrição de capacidade é implicada pela de outro item
+        final boolean[] impliedItem;
+
         @SuppressWarnings("unchecked")
         ProblemData(List<Map<Integer,Integer>> orders,
                     List<Map<Integer,Integer>> aisles,
@@ -302,6 +570,30 @@ public class ChallengeSolver {
             }
 
             pruneDominatedCorridors();
+            impliedItem = findImpliedItems();
+
+            itemOrderStart    = new int[itemCount + 1];
+            itemCorridorStart = new int[itemCount + 1];
+            for (int i = 0; i < itemCount; i++) {
+                itemOrderStart[i + 1]    = itemOrderStart[i]    + ordersRequiringItem[i].size();
+                itemCorridorStart[i + 1] = itemCorridorStart[i] + corridorsContainingItem[i].size();
+            }
+            itemOrders      = new int[itemOrderStart[itemCount]];
+            itemOrderQty    = new int[itemOrders.length];
+            itemCorridors   = new int[itemCorridorStart[itemCount]];
+            itemCorridorQty = new int[itemCorridors.length];
+            for (int i = 0; i < itemCount; i++) {
+                int p = itemOrderStart[i];
+                for (int o : ordersRequiringItem[i]) {
+                    itemOrders[p]     = o;
+                    itemOrderQty[p++] = orderDemand.get(o).get(i);
+                }
+                p = itemCorridorStart[i];
+                for (int a : corridorsContainingItem[i]) {
+                    itemCorridors[p]     = a;
+                    itemCorridorQty[p++] = corridorSupply.get(a).get(i);
+                }
+            }
         }
 
         private void pruneDominatedCorridors() {
@@ -332,6 +624,79 @@ public class ChallengeSolver {
                     corridorsContainingItem[it].remove((Integer) a);
             }
         }
+
+        // a restrição do item i é redundante se existe um item j tal que todo
+        // pedido que requer i requer ao menos a mesma quantidade de j, e todo
+        // corredor que oferece j oferece ao menos a mesma quantidade de i:
+        // demanda_i(x) <= demanda_j(x) <= oferta_j(y) <= oferta_i(y).
+        // Os candidatos j são os itens do primeiro pedido que requer i; em caso
+        // de empate (i e j equivalentes) só o de maior índice é descartado.
+        private boolean[] findImpliedItems() {
+            boolean[] implied = new boolean[itemCount];
+            for (int i = 0; i < itemCount; i++) {
+                if (ordersRequiringItem[i].isEmpty()) continue;
+                for (int j : orderDemand.get(ordersRequiringItem[i].get(0)).keySet()) {
+                    if (j == i) continue;
+                    if (dominates(j, i) && (j < i || !dominates(i, j))) {
+                        implied[i] = true;
+                        break;
+                    }
+                }
+            }
+            return implied;
+        }
+
+        // pickable[k] limita os itens de qualquer onda com k corredores: cada item
+        // contribui no máximo min(demanda total, soma das k maiores ofertas dele)
+        long[] pickableItemsByCorridorCount() {
+            long[] pickable = new long[corridorCount + 1];
+            for (int i = 0; i < itemCount; i++) {
+                long demand = 0;
+                for (int p = itemOrderStart[i]; p < itemOrderStart[i + 1]; p++) demand += itemOrderQty[p];
+                if (demand == 0) continue;
+
+                int[] supply = Arrays.copyOfRange(itemCorridorQty, itemCorridorStart[i], itemCorridorStart[i + 1]);
+                Arrays.sort(supply);
+                long topK = 0;
+                for (int k = 1; k <= corridorCount; k++) {
+                    if (k <= supply.length) topK += supply[supply.length - k];
+                    pickable[k] += Math.min(demand, topK);
+                }
+            }
+            return pickable;
+        }
+
+        // topTotals[k] limita os itens de qualquer onda com k corredores pela soma
+        // dos k corredores de maior oferta útil (oferta de cada item limitada à
+        // sua demanda total)
+        long[] topCorridorTotalsByCorridorCount() {
+            long[] totals = new long[corridorCount];
+            for (int i = 0; i < itemCount; i++) {
+                long demand = 0;
+                for (int p = itemOrderStart[i]; p < itemOrderStart[i + 1]; p++) demand += itemOrderQty[p];
+                for (int p = itemCorridorStart[i]; p < itemCorridorStart[i + 1]; p++)
+                    totals[itemCorridors[p]] += Math.min(demand, itemCorridorQty[p]);
+            }
+            Arrays.sort(totals);
+
+            long[] topTotals = new long[corridorCount + 1];
+            for (int k = 1; k <= corridorCount; k++)
+                topTotals[k] = topTotals[k - 1] + totals[corridorCount - k];
+            return topTotals;
+        }
+
+        // true se a restrição de j implica a de i
+        private boolean dominates(int j, int i) {
+            for (int o : ordersRequiringItem[i]) {
+                var demand = orderDemand.get(o);
+                if (demand.getOrDefault(j, 0) < demand.get(i)) return false;
+            }
+            for (int a : corridorsContainingItem[j]) {
+                var supply = corridorSupply.get(a);
+                if (supply.getOrDefault(i, 0) < supply.get(j)) return false;
+            }
+            return true;
+        }
     }
 
     // ======================= RESULTADO =======================